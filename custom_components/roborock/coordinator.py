@@ -3,12 +3,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import defaultdict
 from datetime import timedelta
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from roborock.api import RoborockClient
 from roborock.cloud_api import RoborockMqttClient
+from roborock.command_cache import CacheableAttribute
 from roborock.containers import HomeDataRoom, MultiMapsList, RoborockBase
 from roborock.exceptions import RoborockException
 
@@ -41,6 +43,8 @@ class RoborockDataUpdateCoordinator(
         self.device_info = device_info
         self.rooms = rooms
         self.scheduled_refresh: asyncio.TimerHandle | None = None
+        # Serializes read-modify-write updates of a cached attribute shared by several entities
+        self.cache_locks: defaultdict[CacheableAttribute, asyncio.Lock] = defaultdict(asyncio.Lock)
 
     def schedule_refresh(self) -> None:
         """Schedule coordinator refresh after 1 second."""
@@ -55,6 +59,9 @@ class RoborockDataUpdateCoordinator(
         if self.scheduled_refresh:
             self.scheduled_refresh.cancel()
         self.api.sync_disconnect()
+        # Stop the attribute caches refreshing themselves once the entities are gone
+        for attribute_cache in self.api.cache.values():
+            attribute_cache.stop()
         if self.api != self.map_api:
             try:
                 self.map_api.sync_disconnect()
@@ -22,7 +22,7 @@ class ConfigEntryData(TypedDict):
     device_network: dict[str, DeviceNetwork]
 
 
-@dataclass
+@dataclass(slots=True)
 class RoborockHassDeviceInfo(DeviceData):
     """Define a help class to carry device information."""
 
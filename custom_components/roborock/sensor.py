@@ -3,9 +3,10 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
 
 from roborock.roborock_message import RoborockDataProtocol
 
@@ -21,13 +22,13 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util, slugify
-from roborock import DeviceProp
 
 from . import EntryData
 from .const import DOMAIN
 from .coordinator import RoborockDataUpdateCoordinator
 from .device import RoborockCoordinatedEntity
 from .roborock_typing import RoborockHassDeviceInfo
+from .utils import get_map_flag
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -58,8 +59,10 @@ ATTR_CURRENT_ROOM = "room"
 ATTR_MOP_DRYING_REMAINING_TIME = "rdt"
 ATTR_CLEANING_PROGRESS = "clean_percent"
 
+_MISSING = object()
 
-@dataclass
+
+@dataclass(slots=True)
 class RoborockSensorDescription(SensorEntityDescription):
     """A class that describes sensor entities."""
 
@@ -68,6 +71,32 @@ class RoborockSensorDescription(SensorEntityDescription):
     keys: list[str] = None
     value: Callable = None
     protocol_listener: RoborockDataProtocol | None = None
+    _parent_getter: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _extract: Callable = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Prebuild the getters used on every update."""
+        if self.parent_key:
+            self._parent_getter = attrgetter(self.parent_key)
+        if self.keys:
+            self._extract = _any_values_getter(attrgetter(*self.keys))
+        else:
+            self._extract = attrgetter(self.key)
+
+
+def _any_values_getter(getter: attrgetter) -> Callable:
+    """Return a getter for multiple keys that gives None when all are unset."""
+
+    def extract(data):
+        values = getter(data)
+        return values if any(values) else None
+
+    return extract
+
+
+def _to_square_meters(value: int, _: RoborockHassDeviceInfo) -> float:
+    """Convert an area reported in mm² to m²."""
+    return round(value / 1000000, 1)
 
 
 VACUUM_SENSORS = {
@@ -102,7 +131,7 @@ VACUUM_SENSORS = {
     f"last_clean_{ATTR_LAST_CLEAN_AREA}": RoborockSensorDescription(
         native_unit_of_measurement=AREA_SQUARE_METERS,
         key="area",
-        value=lambda value, _: round(value / 1000000, 1),
+        value=_to_square_meters,
         icon="mdi:texture-box",
         parent_key="last_clean_record",
         name="Last clean area",
@@ -133,7 +162,7 @@ VACUUM_SENSORS = {
         native_unit_of_measurement=AREA_SQUARE_METERS,
         icon="mdi:texture-box",
         key="clean_area",
-        value=lambda value, _: round(value / 1000000, 1),
+        value=_to_square_meters,
         parent_key="status",
         entity_category=EntityCategory.DIAGNOSTIC,
         name="Current clean area",
@@ -142,7 +171,7 @@ VACUUM_SENSORS = {
     f"current_{ATTR_SELECTED_MAP}": RoborockSensorDescription(
         key="map_status",
         value=lambda value, device_info:
-        slugify(device_info.map_mapping.get((value - 3) // 4))
+        slugify(device_info.map_mapping.get(get_map_flag(value)))
         if device_info and device_info.map_mapping else None,
         icon="mdi:floor-plan",
         parent_key="status",
@@ -176,7 +205,7 @@ VACUUM_SENSORS = {
     f"clean_history_{ATTR_CLEAN_SUMMARY_TOTAL_AREA}": RoborockSensorDescription(
         native_unit_of_measurement=AREA_SQUARE_METERS,
         key="clean_area",
-        value=lambda value, _: round(value / 1000000, 1),
+        value=_to_square_meters,
         icon="mdi:texture-box",
         parent_key="clean_summary",
         name="Total clean area",
@@ -275,8 +304,7 @@ VACUUM_SENSORS = {
     ),
 }
 
-VACUUM_WITH_DOCK_SENSORS = {
-    **VACUUM_SENSORS,
+DOCK_SENSORS = {
     f"current_{ATTR_DOCK_WASHING_MODE}": RoborockSensorDescription(
         key="wash_towel_mode",
         value=lambda value, _: value.wash_mode.value,
@@ -315,6 +343,17 @@ VACUUM_WITH_DOCK_SENSORS = {
     ),
 }
 
+_VACUUM_SENSORS_ITEMS: tuple[tuple[str, RoborockSensorDescription], ...] = tuple(
+    VACUUM_SENSORS.items()
+)
+_VACUUM_WITH_DOCK_SENSORS_ITEMS: tuple[tuple[str, RoborockSensorDescription], ...] = (
+    _VACUUM_SENSORS_ITEMS + tuple(DOCK_SENSORS.items())
+)
+
+_SENSOR_PARENT_KEYS = frozenset(
+    description.parent_key for _, description in _VACUUM_WITH_DOCK_SENSORS_ITEMS
+)
+
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -327,35 +366,40 @@ async def async_setup_entry(
     ]
 
     entities: list[RoborockSensor] = []
-    for _device_id, device_entry_data in domain_data.get("devices").items():
+    for device_entry_data in domain_data.get("devices").values():
         coordinator = device_entry_data["coordinator"]
         device_info = coordinator.data
-        unique_id = slugify(device_info.device.duid)
-        if device_info:
-            device_prop = device_info.props
-            if device_prop:
-                sensors = VACUUM_SENSORS
-                if device_prop.dock_summary:
-                    sensors = VACUUM_WITH_DOCK_SENSORS
-                for sensor, description in sensors.items():
-                    parent_key_data = getattr(device_prop, description.parent_key)
-                    if parent_key_data is None:
-                        _LOGGER.debug(
-                            "It seems the %s does not support the %s as the initial value is None",
-                            device_info.model,
-                            sensor,
-                        )
-                        continue
-                    entities.append(
-                        RoborockSensor(
-                            f"{sensor}_{unique_id}",
-                            device_info,
-                            coordinator,
-                            description,
-                        )
-                    )
-        else:
+        if device_info is None:
             _LOGGER.warning("Failed setting up sensors no Roborock data")
+            continue
+        device_prop = device_info.props
+        if device_prop is None:
+            continue
+        unique_id_suffix = "_" + slugify(device_info.device.duid)
+        available_parent_keys = {
+            parent_key
+            for parent_key in _SENSOR_PARENT_KEYS
+            if getattr(device_prop, parent_key, None) is not None
+        }
+        sensors = _VACUUM_SENSORS_ITEMS
+        if "dock_summary" in available_parent_keys:
+            sensors = _VACUUM_WITH_DOCK_SENSORS_ITEMS
+        for sensor, description in sensors:
+            if description.parent_key not in available_parent_keys:
+                _LOGGER.debug(
+                    "It seems the %s does not support the %s as the initial value is None",
+                    device_info.model,
+                    sensor,
+                )
+                continue
+            entities.append(
+                RoborockSensor(
+                    sensor + unique_id_suffix,
+                    device_info,
+                    coordinator,
+                    description,
+                )
+            )
 
     async_add_entities(entities)
 
@@ -363,6 +407,13 @@ async def async_setup_entry(
 class RoborockSensor(RoborockCoordinatedEntity, SensorEntity):
     """Representation of a Roborock sensor."""
 
+    __slots__ = (
+        "_is_timestamp",
+        "_skip_unchanged_parent",
+        "_last_parent_data",
+        "_written_available",
+    )
+
     entity_description: RoborockSensorDescription
 
     def __init__(
@@ -376,65 +427,82 @@ class RoborockSensor(RoborockCoordinatedEntity, SensorEntity):
         SensorEntity.__init__(self)
         RoborockCoordinatedEntity.__init__(self, device_info, coordinator, unique_id)
         self.entity_description = description
-        self._attr_native_value = self._determine_native_value()
-        self._attr_extra_state_attributes = self._extract_attributes(
-            coordinator.data.props
-        )
+        self._is_timestamp = self.device_class == SensorDeviceClass.TIMESTAMP
+        # Roborock replaces the parent object (status, consumable...) whenever the
+        # device reports new values, so an identical parent means an identical value.
+        # Resolvers may also read the device info, so those are always recomputed.
+        self._skip_unchanged_parent = bool(description.parent_key) and not description.value
+        self._last_parent_data = None
+        self._written_available = None
+        parent_data = self._get_parent_data()
+        self._attr_native_value = self._determine_native_value(parent_data)
+        self._attr_extra_state_attributes = self._extract_attributes(parent_data)
         if (protocol := self.entity_description.protocol_listener) is not None:
             self.api.add_listener(protocol, self._update_from_listener, self.api.cache)
 
+    def _get_parent_data(self):
+        """Return the device prop object the sensor reads from."""
+        data = self.coordinator.data.props
+        parent_getter = self.entity_description._parent_getter
+        if data is not None and parent_getter is not None:
+            data = parent_getter(data)
+        return data
 
     @callback
-    def _extract_attributes(self, data: DeviceProp):
+    def _extract_attributes(self, data):
         """Return state attributes with valid values."""
-        if self.entity_description.parent_key:
-            data = getattr(data, self.entity_description.parent_key)
-            if data is None:
-                return
+        attributes = self.entity_description.attributes
+        if not attributes or data is None:
+            return
         return {
-            attr: getattr(data, attr)
-            for attr in self.entity_description.attributes
-            if hasattr(data, attr)
+            attr: value
+            for attr in attributes
+            if (value := getattr(data, attr, _MISSING)) is not _MISSING
         }
 
     @callback
     def _handle_coordinator_update(self):
         """Fetch state from the device."""
-        native_value = self._determine_native_value()
+        parent_data = self._get_parent_data()
+        if (
+            self._skip_unchanged_parent
+            and parent_data is not None
+            and parent_data is self._last_parent_data
+        ):
+            if self.available is not self._written_available:
+                self._written_available = self.available
+                super()._handle_coordinator_update()
+            return
+        native_value = self._determine_native_value(parent_data)
         # Sometimes (quite rarely) the device returns None as the sensor value so we
         # check that the value: before updating the state.
         if native_value is not None:
-            data = self.coordinator.data.props
+            extra_state_attributes = self._extract_attributes(parent_data)
+            self._last_parent_data = parent_data
+            if (
+                native_value == self._attr_native_value
+                and extra_state_attributes == self._attr_extra_state_attributes
+                and self.available is self._written_available
+            ):
+                return
             self._attr_native_value = native_value
-            self._attr_extra_state_attributes = self._extract_attributes(data)
+            self._attr_extra_state_attributes = extra_state_attributes
+            self._written_available = self.available
             super()._handle_coordinator_update()
 
-    def _determine_native_value(self):
+    def _determine_native_value(self, data):
         """Determine native value."""
-        data = self.coordinator.data.props
         if data is None:
             return
-        if self.entity_description.parent_key:
-            data = getattr(data, self.entity_description.parent_key)
-            if data is None:
-                return
-
-        if self.entity_description.keys:
-            native_value = [getattr(data, key) for key in self.entity_description.keys]
-            if not any(native_value):
-                native_value = None
-        else:
-            native_value = getattr(data, self.entity_description.key)
 
+        description = self.entity_description
+        native_value = description._extract(data)
         if native_value is not None:
             if isinstance(native_value, Enum):
                 native_value = native_value.name
-            if self.entity_description.value:
-                device_info = self.coordinator.data
-                native_value = self.entity_description.value(native_value, device_info)
-            if self.device_class == SensorDeviceClass.TIMESTAMP and (
-                    native_datetime := datetime.fromtimestamp(native_value)
-            ):
-                native_value = native_datetime.astimezone(dt_util.UTC)
+            if (value := description.value) is not None:
+                native_value = value(native_value, self._device_info)
+            if self._is_timestamp:
+                native_value = datetime.fromtimestamp(native_value, tz=dt_util.UTC)
 
         return native_value
@@ -10,16 +10,17 @@ from typing import Any
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import slugify
-from roborock.api import AttributeCache, RoborockClient
+from roborock.api import AttributeCache
 from roborock.command_cache import CacheableAttribute
+from roborock.exceptions import RoborockException
 
 from . import EntryData, RoborockHassDeviceInfo
 from .const import DOMAIN
 from .coordinator import RoborockDataUpdateCoordinator
-from .device import RoborockEntity
+from .device import RoborockCoordinatedEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,14 +37,24 @@ class RoborockSwitchDescriptionMixin:
     attribute: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RoborockSwitchDescription(
     SwitchEntityDescription, RoborockSwitchDescriptionMixin
 ):
     """Class to describe an Roborock switch entity."""
 
 
-SWITCH_DESCRIPTIONS: list[RoborockSwitchDescription] = [
+def _update_timer(cache: AttributeCache, value: bool) -> Coroutine[Any, Any, dict]:
+    """Re-enable a timer with its current schedule or close it."""
+    if value:
+        timer = cache.value
+        return cache.update_value(
+            [timer.get("start_hour"), timer.get("start_minute"), timer.get("end_hour"), timer.get("end_minute")]
+        )
+    return cache.close_value()
+
+
+SWITCH_DESCRIPTIONS: tuple[RoborockSwitchDescription, ...] = (
     RoborockSwitchDescription(
         cache_key=CacheableAttribute.child_lock_status,
         update_value=lambda cache, value: cache.update_value({"lock_status": 1 if value else 0}),
@@ -66,13 +77,7 @@ SWITCH_DESCRIPTIONS: list[RoborockSwitchDescription] = [
     ),
     RoborockSwitchDescription(
         cache_key=CacheableAttribute.dnd_timer,
-        update_value=lambda cache, value: cache.update_value([
-                cache.value.get("start_hour"),
-                cache.value.get("start_minute"),
-                cache.value.get("end_hour"),
-                cache.value.get("end_minute"),
-            ]) if value
-        else cache.close_value(),
+        update_value=_update_timer,
         attribute="enabled",
         key="dnd_switch",
         name="DnD switch",
@@ -82,13 +87,7 @@ SWITCH_DESCRIPTIONS: list[RoborockSwitchDescription] = [
     ),
     RoborockSwitchDescription(
         cache_key=CacheableAttribute.valley_electricity_timer,
-        update_value=lambda cache, value: cache.update_value([
-                cache.value.get("start_hour"),
-                cache.value.get("start_minute"),
-                cache.value.get("end_hour"),
-                cache.value.get("end_minute"),
-            ]) if value
-        else cache.close_value(),
+        update_value=_update_timer,
         attribute="enabled",
         key="valley_electricity_switch",
         name="Off-Peak charging switch",
@@ -96,7 +95,7 @@ SWITCH_DESCRIPTIONS: list[RoborockSwitchDescription] = [
         icon="mdi:bell-cancel",
         entity_category=EntityCategory.CONFIG,
     ),
-]
+)
 
 
 async def async_setup_entry(
@@ -108,37 +107,47 @@ async def async_setup_entry(
     domain_data: EntryData = hass.data[DOMAIN][config_entry.entry_id]
     coordinators = [device_entry_data["coordinator"] for device_entry_data in domain_data.get("devices").values()]
     possible_entities: list[
-        tuple[RoborockDataUpdateCoordinator, RoborockSwitchDescription]
-    ] = [
-        (coordinator, description)
-        for coordinator in coordinators
-        for description in SWITCH_DESCRIPTIONS
-    ]
-    # We need to check if this function is supported by the device.
-    results = await asyncio.gather(
-        *(coordinator.api.cache.get(description.cache_key).async_value()
-          for coordinator, description in possible_entities),
-        return_exceptions=True
-    )
-    valid_entities: list[RoborockSwitch] = []
-    for (coordinator, description), result in zip(possible_entities, results):
+        tuple[
+            tuple[str, RoborockHassDeviceInfo, RoborockDataUpdateCoordinator, RoborockSwitchDescription],
+            AttributeCache,
+        ]
+    ] = []
+    # Descriptions sharing a cache key only need to be probed once per device.
+    probes: dict[AttributeCache, Coroutine[Any, Any, Any]] = {}
+    for coordinator in coordinators:
         device_info = coordinator.data
-        if result is None or isinstance(result, Exception):
+        unique_id = slugify(device_info.device.duid)
+        cache = coordinator.api.cache
+        for description in SWITCH_DESCRIPTIONS:
+            attribute_cache = cache.get(description.cache_key)
+            possible_entities.append(
+                ((f"{description.key}_{unique_id}", device_info, coordinator, description), attribute_cache)
+            )
+            if attribute_cache not in probes:
+                probes[attribute_cache] = attribute_cache.async_value()
+    # We need to check if this function is supported by the device.
+    supported: dict[AttributeCache, bool] = {}
+    for attribute_cache, result in zip(probes, await asyncio.gather(*probes.values(), return_exceptions=True)):
+        # Only communication errors mean the device doesn't support the attribute.
+        if isinstance(result, RoborockException) or result is None:
             _LOGGER.debug("Not adding entity because of %s", result)
+            supported[attribute_cache] = False
+        elif isinstance(result, BaseException):
+            raise result
         else:
-            valid_entities.append(
-                RoborockSwitch(
-                    f"{description.key}_{slugify(coordinator.data.device.duid)}",
-                    device_info,
-                    description,
-                    coordinator.api,
-                )
-            )
+            supported[attribute_cache] = True
+    valid_entities: list[RoborockSwitch] = [
+        RoborockSwitch(*entity_args)
+        for entity_args, attribute_cache in possible_entities
+        if supported[attribute_cache]
+    ]
     async_add_entities(valid_entities)
 
 
-class RoborockSwitch(RoborockEntity, SwitchEntity):
-    """A class to let you turn functionality on Roborock devices on and off that does need a coordinator."""
+class RoborockSwitch(RoborockCoordinatedEntity, SwitchEntity):
+    """A class to let you turn functionality on Roborock devices on and off."""
+
+    __slots__ = ("_attribute_cache",)
 
     entity_description: RoborockSwitchDescription
 
@@ -146,23 +155,38 @@ class RoborockSwitch(RoborockEntity, SwitchEntity):
             self,
             unique_id: str,
             device_info: RoborockHassDeviceInfo,
+            coordinator: RoborockDataUpdateCoordinator,
             description: RoborockSwitchDescription,
-            api: RoborockClient,
     ) -> None:
         """Initialize the entity."""
         SwitchEntity.__init__(self)
-        RoborockEntity.__init__(self, device_info, unique_id, api)
+        RoborockCoordinatedEntity.__init__(self, device_info, coordinator, unique_id)
         self.entity_description = description
+        self._attribute_cache = self.api.cache.get(description.cache_key)
+        self._update_is_on()
+
+    def _update_is_on(self) -> None:
+        """Update the switch from the attribute cache, keeping the last state if the cache has none."""
+        value = self._attribute_cache.value
+        if value and (status := value.get(self.entity_description.attribute)) is not None:
+            self._attr_is_on = status == 1
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the switch from the attribute cache."""
+        self._update_is_on()
+        super()._handle_coordinator_update()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
-        await self.entity_description.update_value(self.api.cache.get(self.entity_description.cache_key), False)
+        async with self.coordinator.cache_locks[self.entity_description.cache_key]:
+            await self.entity_description.update_value(self._attribute_cache, False)
+        self._update_is_on()
+        self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the switch."""
-        await self.entity_description.update_value(self.api.cache.get(self.entity_description.cache_key), True)
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if entity is on."""
-        return self.api.cache.get(self.entity_description.cache_key).value.get(self.entity_description.attribute) == 1
+        async with self.coordinator.cache_locks[self.entity_description.cache_key]:
+            await self.entity_description.update_value(self._attribute_cache, True)
+        self._update_is_on()
+        self.async_write_ha_state()
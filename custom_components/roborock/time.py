@@ -6,25 +6,67 @@ import datetime
 import logging
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
-from roborock.api import AttributeCache, RoborockClient
+from roborock.api import AttributeCache
 from roborock.command_cache import CacheableAttribute
+from roborock.exceptions import RoborockException
 
 from homeassistant.components.time import TimeEntity, TimeEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import slugify
 from . import EntryData, RoborockDataUpdateCoordinator
 from .const import DOMAIN
-from .device import RoborockEntity
+from .device import RoborockCoordinatedEntity
 from .roborock_typing import RoborockHassDeviceInfo
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1440)
+def _time(hour: int, minute: int) -> datetime.time:
+    """Return a (cached) time for the given hour and minute."""
+    return datetime.time(hour=hour, minute=minute)
+
+
+def _get_timer_time(cache: AttributeCache, hour_key: str, minute_key: str) -> datetime.time | None:
+    """Get a time of a timer, if the cache has a complete one."""
+    value = cache.value
+    if not value or (hour := value.get(hour_key)) is None or (minute := value.get(minute_key)) is None:
+        return None
+    return _time(hour, minute)
+
+
+def _get_start_time(cache: AttributeCache) -> datetime.time | None:
+    """Get the start time of a timer."""
+    return _get_timer_time(cache, "start_hour", "start_minute")
+
+
+def _get_end_time(cache: AttributeCache) -> datetime.time | None:
+    """Get the end time of a timer."""
+    return _get_timer_time(cache, "end_hour", "end_minute")
+
+
+def _update_start_time(cache: AttributeCache, desired_time: datetime.time) -> Coroutine[Any, Any, dict]:
+    """Set the start time of a timer, keeping its end time."""
+    value = cache.value
+    return cache.update_value(
+        [desired_time.hour, desired_time.minute, value.get("end_hour"), value.get("end_minute")]
+    )
+
+
+def _update_end_time(cache: AttributeCache, desired_time: datetime.time) -> Coroutine[Any, Any, dict]:
+    """Set the end time of a timer, keeping its start time."""
+    value = cache.value
+    return cache.update_value(
+        [value.get("start_hour"), value.get("start_minute"), desired_time.hour, desired_time.minute]
+    )
+
+
 @dataclass
 class RoborockTimeDescriptionMixin:
     """Define an entity description mixin for time entities."""
@@ -34,33 +76,23 @@ class RoborockTimeDescriptionMixin:
     # Sets the status of the switch
     update_value: Callable[[AttributeCache, datetime.time], Coroutine[Any, Any, dict]]
     # Attribute from cache
-    get_value: Callable[[AttributeCache], datetime.time]
+    get_value: Callable[[AttributeCache], datetime.time | None]
 
 
-@dataclass
+@dataclass(slots=True)
 class RoborockTimeDescription(TimeEntityDescription, RoborockTimeDescriptionMixin):
     """Class to describe an Roborock time entity."""
 
 
-TIME_DESCRIPTIONS: list[RoborockTimeDescription] = [
+TIME_DESCRIPTIONS: tuple[RoborockTimeDescription, ...] = (
     RoborockTimeDescription(
         key="dnd_start",
         name="DnD start",
         translation_key="dnd_start",
         icon="mdi:bell-cancel",
         cache_key=CacheableAttribute.dnd_timer,
-        update_value=lambda cache, desired_time: cache.update_value(
-            [
-                desired_time.hour,
-                desired_time.minute,
-                cache.value.get("end_hour"),
-                cache.value.get("end_minute"),
-            ]
-        ),
-        get_value=lambda cache: datetime.time(
-            hour=cache.value.get("start_hour"),
-            minute=cache.value.get("start_minute")
-            ),
+        update_value=_update_start_time,
+        get_value=_get_start_time,
         entity_category=EntityCategory.CONFIG,
     ),
     RoborockTimeDescription(
@@ -69,18 +101,8 @@ TIME_DESCRIPTIONS: list[RoborockTimeDescription] = [
         translation_key="dnd_end",
         icon="mdi:bell-ring",
         cache_key=CacheableAttribute.dnd_timer,
-        update_value=lambda cache, desired_time: cache.update_value(
-            [
-                cache.value.get("start_hour"),
-                cache.value.get("start_minute"),
-                desired_time.hour,
-                desired_time.minute,
-            ]
-        ),
-        get_value=lambda cache: datetime.time(
-            hour=cache.value.get("end_hour"),
-            minute=cache.value.get("end_minute")
-        ),
+        update_value=_update_end_time,
+        get_value=_get_end_time,
         entity_category=EntityCategory.CONFIG,
     ),
     RoborockTimeDescription(
@@ -89,18 +111,8 @@ TIME_DESCRIPTIONS: list[RoborockTimeDescription] = [
         translation_key="valley_electricity_start",
         icon="mdi:bell-ring",
         cache_key=CacheableAttribute.valley_electricity_timer,
-        update_value=lambda cache, desired_time: cache.update_value(
-            [
-                desired_time.hour,
-                desired_time.minute,
-                cache.value.get("end_hour"),
-                cache.value.get("end_minute"),
-            ]
-        ),
-        get_value=lambda cache: datetime.time(
-            hour=cache.value.get("start_hour"),
-            minute=cache.value.get("start_minute")
-        ),
+        update_value=_update_start_time,
+        get_value=_get_start_time,
         entity_category=EntityCategory.CONFIG,
     ),
     RoborockTimeDescription(
@@ -109,21 +121,11 @@ TIME_DESCRIPTIONS: list[RoborockTimeDescription] = [
         translation_key="valley_electricity_end",
         icon="mdi:bell-ring",
         cache_key=CacheableAttribute.valley_electricity_timer,
-        update_value=lambda cache, desired_time: cache.update_value(
-            [
-                cache.value.get("start_hour"),
-                cache.value.get("start_minute"),
-                desired_time.hour,
-                desired_time.minute,
-            ]
-        ),
-        get_value=lambda cache: datetime.time(
-            hour=cache.value.get("end_hour"),
-            minute=cache.value.get("end_minute")
-        ),
+        update_value=_update_end_time,
+        get_value=_get_end_time,
         entity_category=EntityCategory.CONFIG,
     ),
-]
+)
 
 
 async def async_setup_entry(
@@ -136,57 +138,72 @@ async def async_setup_entry(
     coordinators = [device_entry_data["coordinator"] for device_entry_data in domain_data.get("devices").values()]
 
     possible_entities: list[
-        tuple[RoborockDataUpdateCoordinator, RoborockTimeDescription]
-    ] = [
-        (coordinator, description)
-        for coordinator in coordinators
-        for description in TIME_DESCRIPTIONS
-    ]
+        tuple[str, RoborockDataUpdateCoordinator, RoborockTimeDescription, AttributeCache]
+    ] = []
+    # The start and end entities of a timer share a cache key, so only probe it once per device.
+    probes: dict[AttributeCache, Coroutine[Any, Any, Any]] = {}
+    for coordinator in coordinators:
+        unique_id = slugify(coordinator.data.device.duid)
+        cache = coordinator.api.cache
+        for description in TIME_DESCRIPTIONS:
+            attribute_cache = cache.get(description.cache_key)
+            possible_entities.append((f"{description.key}_{unique_id}", coordinator, description, attribute_cache))
+            if attribute_cache not in probes:
+                probes[attribute_cache] = attribute_cache.async_value()
     # We need to check if this function is supported by the device.
-    results = await asyncio.gather(
-        *(coordinator.api.cache.get(description.cache_key).async_value()
-          for coordinator, description in possible_entities),
-        return_exceptions=True
-    )
-    valid_entities: list[RoborockTime] = []
-    for (coordinator, description), result in zip(possible_entities, results):
-        device_info = coordinator.data
-        if result is None or isinstance(result, Exception):
+    supported: dict[AttributeCache, bool] = {}
+    for attribute_cache, result in zip(probes, await asyncio.gather(*probes.values(), return_exceptions=True)):
+        # Only communication errors mean the device doesn't support the attribute.
+        if isinstance(result, RoborockException) or result is None:
             _LOGGER.debug("Not adding entity because of %s", result)
+            supported[attribute_cache] = False
+        elif isinstance(result, BaseException):
+            raise result
         else:
-            valid_entities.append(
-                RoborockTime(
-                    f"{description.key}_{slugify(coordinator.data.device.duid)}",
-                    device_info,
-                    description,
-                    coordinator.api,
-                )
-            )
+            supported[attribute_cache] = True
+    valid_entities: list[RoborockTime] = [
+        RoborockTime(unique_id, coordinator.data, coordinator, description)
+        for unique_id, coordinator, description, attribute_cache in possible_entities
+        if supported[attribute_cache]
+    ]
     async_add_entities(valid_entities)
 
 
-class RoborockTime(RoborockEntity, TimeEntity):
+class RoborockTime(RoborockCoordinatedEntity, TimeEntity):
     """A class to let you set options on a Roborock vacuum where the potential options are fixed."""
 
+    __slots__ = ("_attribute_cache",)
+
     entity_description: RoborockTimeDescription
 
     def __init__(
             self,
             unique_id: str,
             device_info: RoborockHassDeviceInfo,
+            coordinator: RoborockDataUpdateCoordinator,
             description: RoborockTimeDescription,
-            api: RoborockClient,
     ) -> None:
         """Initialize the entity."""
         TimeEntity.__init__(self)
-        RoborockEntity.__init__(self, device_info, unique_id, api)
+        RoborockCoordinatedEntity.__init__(self, device_info, coordinator, unique_id)
         self.entity_description = description
+        self._attribute_cache = self.api.cache.get(description.cache_key)
+        self._attr_native_value = description.get_value(self._attribute_cache)
+
+    def _update_native_value(self) -> None:
+        """Update the time from the attribute cache, keeping the last time if the cache has none."""
+        if (value := self.entity_description.get_value(self._attribute_cache)) is not None:
+            self._attr_native_value = value
 
-    @property
-    def native_value(self) -> datetime.time | None:
-        """Return the value reported by the time."""
-        return self.entity_description.get_value(self.api.cache.get(self.entity_description.cache_key))
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the time from the attribute cache."""
+        self._update_native_value()
+        super()._handle_coordinator_update()
 
     async def async_set_value(self, value: datetime.time) -> None:
         """Set the time."""
-        await self.entity_description.update_value(self.api.cache.get(self.entity_description.cache_key), value)
+        async with self.coordinator.cache_locks[self.entity_description.cache_key]:
+            await self.entity_description.update_value(self._attribute_cache, value)
+        self._update_native_value()
+        self.async_write_ha_state()
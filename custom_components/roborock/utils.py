@@ -19,3 +19,13 @@ def get_nested_dict(data: dict, key_string: str, default=None) -> dict:
         if here is None:
             return default
     return here
+
+
+def get_map_flag(map_status: int) -> int:
+    """Get the flag of the loaded map from a map status."""
+    return (map_status - 3) // 4
+
+
+def get_map_status(map_flag: int) -> int:
+    """Get the map status of a loaded map from its flag."""
+    return map_flag * 4 + 3
@@ -1,10 +1,12 @@
 """Support for Roborock vacuum class."""
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import logging
 import math
-import time
 from abc import ABC
+from functools import cache
 from typing import Any
 
 import voluptuous as vol
@@ -25,12 +27,14 @@ from homeassistant.components.vacuum import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_BATTERY_LEVEL, ATTR_STATE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.icon import icon_for_battery_level
 from homeassistant.util import slugify
-from roborock import RoborockStateCode
+from roborock import RoborockStateCode, Status
+from roborock.code_mappings import RoborockEnum
 from roborock.roborock_typing import RoborockCommand
 
 from . import EntryData
@@ -38,6 +42,7 @@ from .const import DOMAIN
 from .coordinator import RoborockDataUpdateCoordinator
 from .device import RoborockCoordinatedEntity
 from .roborock_typing import RoborockHassDeviceInfo
+from .utils import get_map_status
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,6 +71,10 @@ STATE_CODE_TO_STATE = {
     RoborockStateCode.charging_complete: STATE_DOCKED,  # "Charging complete"
     RoborockStateCode.device_offline: STATE_ERROR,  # "Device offline"
 }
+# Dense lookup indexed by the raw state code, codes without a mapping are None
+_STATE_TABLE: tuple[str | None, ...] = tuple(
+    STATE_CODE_TO_STATE.get(code) for code in range(max(STATE_CODE_TO_STATE) + 1)
+)
 
 ATTR_STATUS = "status"
 ATTR_MOP_MODE = "mop_mode"
@@ -75,111 +84,140 @@ ATTR_MOP_INTENSITY_LIST = f"{ATTR_MOP_INTENSITY}_list"
 ATTR_ERROR = "error"
 ATTR_ROOMS = "rooms"
 
+_PAUSED_IDLE_OR_ERROR_STATES = frozenset((STATE_PAUSED, STATE_IDLE, STATE_ERROR))
+
+
+def _state_from_code(code: RoborockStateCode | None) -> str | None:
+    """Return the vacuum state for a state code."""
+    if code is None or not 0 <= code < len(_STATE_TABLE):
+        return None
+    return _STATE_TABLE[code]
+
+
+def _code_name(code: RoborockEnum | None) -> str | None:
+    """Return the name of a code, if there is one."""
+    return code.name if code else None
+
+
+@cache
+def _code_names(code_type: type[RoborockEnum]) -> list[str]:
+    """Return the (cached) names of a device specific code enum."""
+    return code_type.keys()
 
+
+@cache
+def _code_values(code_type: type[RoborockEnum]) -> dict[str, int]:
+    """Return the (cached) value by name of a device specific code enum."""
+    return code_type.as_dict()
+
+
+def _code_value(code: RoborockEnum | None, name: str) -> int:
+    """Return the value named name in the same code enum as code."""
+    if code is not None and (value := _code_values(type(code)).get(name)) is not None:
+        return value
+    raise HomeAssistantError(f"{name} is not a valid option")
+
+
+_REPEATS_VALIDATOR = vol.All(vol.Coerce(int), vol.Clamp(min=1, max=3))
+_EMPTY_SCHEMA = cv.make_entity_service_schema({})
+_REMOTE_CONTROL_MOVE_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Optional("velocity"): vol.All(
+            vol.Coerce(float), vol.Clamp(min=-0.29, max=0.29)
+        ),
+        vol.Optional("rotation"): vol.All(
+            vol.Coerce(int), vol.Clamp(min=-179, max=179)
+        ),
+        vol.Optional("duration"): cv.positive_int,
+    }
+)
+_CLEAN_ZONE_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required("zone"): vol.All(
+            list,
+            [
+                vol.ExactSequence(
+                    [
+                        vol.Coerce(int),
+                        vol.Coerce(int),
+                        vol.Coerce(int),
+                        vol.Coerce(int),
+                    ]
+                )
+            ],
+        ),
+        vol.Optional("repeats"): _REPEATS_VALIDATOR,
+    }
+)
+_GOTO_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required("x_coord"): vol.Coerce(int),
+        vol.Required("y_coord"): vol.Coerce(int),
+    }
+)
+_CLEAN_SEGMENT_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required("segments"): vol.Any(vol.Coerce(int), [vol.Coerce(int)], vol.Coerce(str)),
+        vol.Optional("repeats"): _REPEATS_VALIDATOR,
+    }
+)
+_LOAD_MULTI_MAP_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required("map_flag"): vol.All(
+            vol.Coerce(int), vol.Clamp(min=0, max=4)
+        ),
+    }
+)
+
+
+@callback
 def add_services() -> None:
     """Add the vacuum services to hass."""
     platform = entity_platform.async_get_current_platform()
 
     platform.async_register_entity_service(
         "vacuum_remote_control_start",
-        cv.make_entity_service_schema({}),
+        _EMPTY_SCHEMA,
         RoborockVacuum.async_remote_control_start.__name__,
     )
 
     platform.async_register_entity_service(
         "vacuum_remote_control_stop",
-        cv.make_entity_service_schema({}),
+        _EMPTY_SCHEMA,
         RoborockVacuum.async_remote_control_stop.__name__,
     )
 
     platform.async_register_entity_service(
         "vacuum_remote_control_move",
-        cv.make_entity_service_schema(
-            {
-                vol.Optional("velocity"): vol.All(
-                    vol.Coerce(float), vol.Clamp(min=-0.29, max=0.29)
-                ),
-                vol.Optional("rotation"): vol.All(
-                    vol.Coerce(int), vol.Clamp(min=-179, max=179)
-                ),
-                vol.Optional("duration"): cv.positive_int,
-            }
-        ),
+        _REMOTE_CONTROL_MOVE_SCHEMA,
         RoborockVacuum.async_remote_control_move.__name__,
     )
 
     platform.async_register_entity_service(
         "vacuum_remote_control_move_step",
-        cv.make_entity_service_schema(
-            {
-                vol.Optional("velocity"): vol.All(
-                    vol.Coerce(float), vol.Clamp(min=-0.29, max=0.29)
-                ),
-                vol.Optional("rotation"): vol.All(
-                    vol.Coerce(int), vol.Clamp(min=-179, max=179)
-                ),
-                vol.Optional("duration"): cv.positive_int,
-            }
-        ),
+        _REMOTE_CONTROL_MOVE_SCHEMA,
         RoborockVacuum.async_remote_control_move_step.__name__,
     )
 
     platform.async_register_entity_service(
         "vacuum_clean_zone",
-        cv.make_entity_service_schema(
-            {
-                vol.Required("zone"): vol.All(
-                    list,
-                    [
-                        vol.ExactSequence(
-                            [
-                                vol.Coerce(int),
-                                vol.Coerce(int),
-                                vol.Coerce(int),
-                                vol.Coerce(int),
-                            ]
-                        )
-                    ],
-                ),
-                vol.Optional("repeats"): vol.All(
-                    vol.Coerce(int), vol.Clamp(min=1, max=3)
-                ),
-            }
-        ),
+        _CLEAN_ZONE_SCHEMA,
         RoborockVacuum.async_clean_zone.__name__,
     )
 
     platform.async_register_entity_service(
         "vacuum_goto",
-        cv.make_entity_service_schema(
-            {
-                vol.Required("x_coord"): vol.Coerce(int),
-                vol.Required("y_coord"): vol.Coerce(int),
-            }
-        ),
+        _GOTO_SCHEMA,
         RoborockVacuum.async_goto.__name__,
     )
     platform.async_register_entity_service(
         "vacuum_clean_segment",
-        cv.make_entity_service_schema(
-            {
-                vol.Required("segments"): vol.Any(vol.Coerce(int), [vol.Coerce(int)], vol.Coerce(str)),
-                vol.Optional("repeats"): vol.All(
-                    vol.Coerce(int), vol.Clamp(min=1, max=3)
-                ),
-            }
-        ),
+        _CLEAN_SEGMENT_SCHEMA,
         RoborockVacuum.async_clean_segment.__name__,
     )
     platform.async_register_entity_service(
         "vacuum_load_multi_map",
-        cv.make_entity_service_schema(
-            {
-                vol.Required("map_flag"): vol.All(
-                    vol.Coerce(int), vol.Clamp(min=0, max=4)
-                ),
-            }
-        ),
+        _LOAD_MULTI_MAP_SCHEMA,
         RoborockVacuum.async_load_multi_map.__name__,
     )
 
@@ -197,17 +235,46 @@ async def async_setup_entry(
     ]
 
     entities: list[RoborockVacuum] = []
-    for _device_id, device_entry_data in domain_data.get("devices").items():
+    for device_entry_data in domain_data.get("devices").values():
         coordinator = device_entry_data["coordinator"]
-        unique_id = slugify(coordinator.data.device.duid)
-        entities.append(RoborockVacuum(unique_id, coordinator.data, coordinator))
+        device_info = coordinator.data
+        entities.append(RoborockVacuum(slugify(device_info.device.duid), device_info, coordinator))
     async_add_entities(entities)
 
 
 class RoborockVacuum(RoborockCoordinatedEntity, StateVacuumEntity, ABC):
     """General Representation of a Roborock vacuum."""
 
+    __slots__ = (
+        "manual_seqnum",
+        "_device",
+        "_coordinator",
+        "_attributes_status",
+        "_attributes",
+        "_written_available",
+        "_capability_key",
+        "_capability_attributes",
+    )
+
     _attr_name = None
+    _attr_supported_features = (
+        VacuumEntityFeature.TURN_ON
+        | VacuumEntityFeature.TURN_OFF
+        | VacuumEntityFeature.PAUSE
+        | VacuumEntityFeature.STOP
+        | VacuumEntityFeature.RETURN_HOME
+        | VacuumEntityFeature.FAN_SPEED
+        | VacuumEntityFeature.BATTERY
+        | VacuumEntityFeature.STATUS
+        | VacuumEntityFeature.SEND_COMMAND
+        | VacuumEntityFeature.LOCATE
+        | VacuumEntityFeature.CLEAN_SPOT
+        | VacuumEntityFeature.STATE
+        | VacuumEntityFeature.START
+        | VacuumEntityFeature.MAP
+    )
+    _has_battery = bool(_attr_supported_features & VacuumEntityFeature.BATTERY)
+    _has_fan_speed = bool(_attr_supported_features & VacuumEntityFeature.FAN_SPEED)
 
     def __init__(
         self,
@@ -221,30 +288,25 @@ class RoborockVacuum(RoborockCoordinatedEntity, StateVacuumEntity, ABC):
         self.manual_seqnum = 0
         self._device = device
         self._coordinator = coordinator
+        # Status the cached extra state attributes were built from, a new status object is set on every update
+        self._attributes_status: Status | None = None
+        self._attributes: dict[str, Any] = {}
+        self._written_available: bool | None = None
+        # Code enum types the capability attributes were built from, they only change with the device model
+        self._capability_key: tuple[type | None, ...] | None = None
+        self._capability_attributes: dict[str, list[str]] = {}
         self.api.add_listener(RoborockDataProtocol.FAN_POWER, self._update_from_listener, self.api.cache)
         self.api.add_listener(RoborockDataProtocol.STATE, self._update_from_listener, self.api.cache)
 
-
-    @property
-    def supported_features(self) -> VacuumEntityFeature:
-        """Flag vacuum cleaner features that are supported."""
-        features = (
-            VacuumEntityFeature.TURN_ON
-            | VacuumEntityFeature.TURN_OFF
-            | VacuumEntityFeature.PAUSE
-            | VacuumEntityFeature.STOP
-            | VacuumEntityFeature.RETURN_HOME
-            | VacuumEntityFeature.FAN_SPEED
-            | VacuumEntityFeature.BATTERY
-            | VacuumEntityFeature.STATUS
-            | VacuumEntityFeature.SEND_COMMAND
-            | VacuumEntityFeature.LOCATE
-            | VacuumEntityFeature.CLEAN_SPOT
-            | VacuumEntityFeature.STATE
-            | VacuumEntityFeature.START
-            | VacuumEntityFeature.MAP
-        )
-        return features
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write the state when the status or the availability changed."""
+        available = self.available
+        # Every refresh sets a new status object, compare it to the one the state was last built from
+        if available is self._written_available and self._device_status == self._attributes_status:
+            return
+        self._written_available = available
+        super()._handle_coordinator_update()
 
     @property
     def icon(self) -> str:
@@ -261,37 +323,43 @@ class RoborockVacuum(RoborockCoordinatedEntity, StateVacuumEntity, ABC):
         """Return the status of the vacuum cleaner."""
         if self._device_status is None:
             return None
-        state = self._device_status.state
-        return STATE_CODE_TO_STATE.get(state)
+        return _state_from_code(self._device_status.state)
 
     @property
     def status(self) -> str | None:
         """Return the status of the vacuum cleaner."""
         if self._device_status is None:
             return None
-        return self._device_status.state.name if self._device_status.state else None
+        return _code_name(self._device_status.state)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes of the vacuum cleaner."""
-        if self._device_status is None:
+        status = self._device_status
+        if status is None:
             return {}
-        data: dict[str, Any] = dict(self._device_status.as_dict())
-
-        if self.supported_features & VacuumEntityFeature.BATTERY:
-            data[ATTR_BATTERY_LEVEL] = self.battery_level
-            data[ATTR_BATTERY_ICON] = self.battery_icon
+        if status is self._attributes_status:
+            return self._attributes
+        data: dict[str, Any] = dict(status.as_dict())
+        state = _state_from_code(status.state)
+
+        if self._has_battery:
+            data[ATTR_BATTERY_LEVEL] = status.battery
+            data[ATTR_BATTERY_ICON] = icon_for_battery_level(
+                battery_level=status.battery, charging=state == STATE_DOCKED
+            )
 
-        if self.supported_features & VacuumEntityFeature.FAN_SPEED:
-            data[ATTR_FAN_SPEED] = self.fan_speed
+        if self._has_fan_speed:
+            data[ATTR_FAN_SPEED] = _code_name(status.fan_power)
 
-        data[ATTR_STATE] = self.state
-        data[ATTR_STATUS] = self.status
-        data[ATTR_MOP_MODE] = self.mop_mode
-        data[ATTR_MOP_INTENSITY] = self.mop_intensity
-        data[ATTR_ERROR] = self.error
-        data.update(self.capability_attributes)
+        data[ATTR_STATE] = state
+        data[ATTR_STATUS] = _code_name(status.state)
+        data[ATTR_MOP_MODE] = _code_name(status.mop_mode)
+        data[ATTR_MOP_INTENSITY] = _code_name(status.water_box_mode)
+        data[ATTR_ERROR] = _code_name(status.error_code)
 
+        self._attributes_status = status
+        self._attributes = data
         return data
 
     @property
@@ -306,68 +374,84 @@ class RoborockVacuum(RoborockCoordinatedEntity, StateVacuumEntity, ABC):
         """Return the fan speed of the vacuum cleaner."""
         if self._device_status is None:
             return None
-        return self._device_status.fan_power.name if self._device_status.fan_power else None
+        return _code_name(self._device_status.fan_power)
 
     @property
     def fan_speed_list(self) -> list[str]:
         """Get the list of available fan speed steps of the vacuum cleaner."""
-        return self._device_status.fan_power.keys() if self._device_status.fan_power else None
+        fan_power = self._device_status.fan_power
+        return _code_names(type(fan_power)) if fan_power else None
 
     @property
     def mop_mode(self) -> str | None:
         """Return the mop mode of the vacuum cleaner."""
         if self._device_status is None:
             return None
-        return self._device_status.mop_mode.name if self._device_status.mop_mode else None
+        return _code_name(self._device_status.mop_mode)
 
     @property
     def mop_mode_list(self) -> list[str]:
         """Get the list of available mop mode steps of the vacuum cleaner."""
-        return self._device_status.mop_mode.keys() if self._device_status.mop_mode else None
+        mop_mode = self._device_status.mop_mode
+        return _code_names(type(mop_mode)) if mop_mode else None
 
     @property
     def mop_intensity(self) -> str | None:
         """Return the mop intensity of the vacuum cleaner."""
         if self._device_status is None:
             return None
-        return self._device_status.water_box_mode.name if self._device_status.water_box_mode else None
+        return _code_name(self._device_status.water_box_mode)
 
     @property
     def mop_intensity_list(self) -> list[str]:
         """Get the list of available mop intensity steps of the vacuum cleaner."""
-        return self._device_status.water_box_mode.keys() if self._device_status.water_box_mode else None
+        water_box_mode = self._device_status.water_box_mode
+        return _code_names(type(water_box_mode)) if water_box_mode else None
 
     @property
     def error(self) -> str | None:
         """Get the error translated if one exist."""
-        return self._device_status.error_code.name if self._device_status.error_code else None
+        return _code_name(self._device_status.error_code)
 
     @property
     def capability_attributes(self) -> dict[str, list[str]]:
         """Return capability attributes."""
+        status = self._device_status
+        key = tuple(
+            type(code) if code else None for code in (status.fan_power, status.mop_mode, status.water_box_mode)
+        )
+        if key == self._capability_key:
+            return self._capability_attributes
         capability_attributes = {}
-        if self.supported_features & VacuumEntityFeature.FAN_SPEED:
+        if self._has_fan_speed:
             capability_attributes[ATTR_FAN_SPEED_LIST] = self.fan_speed_list
         capability_attributes[ATTR_MOP_MODE_LIST] = self.mop_mode_list
         capability_attributes[ATTR_MOP_INTENSITY_LIST] = self.mop_intensity_list
+        self._capability_key = key
+        self._capability_attributes = capability_attributes
         return capability_attributes
 
     def is_paused_idle_or_error(self) -> bool:
         """Return if the vacuum is in paused, idle or error state."""
-        return self.state == STATE_PAUSED or self.state == STATE_IDLE or self.state == STATE_ERROR
+        return self.state in _PAUSED_IDLE_OR_ERROR_STATES
 
     async def async_start(self) -> None:
         """Start the vacuum."""
-        if self.is_paused_idle_or_error() and self._device_status.in_cleaning == 2:
+        resumable = self.is_paused_idle_or_error()
+        if resumable and self._device_status.in_cleaning == 2:
             await self.send(RoborockCommand.RESUME_ZONED_CLEAN)
-        elif self.is_paused_idle_or_error() and self._device_status.in_cleaning == 3:
+            self._set_status(state=RoborockStateCode.zoned_cleaning)
+        elif resumable and self._device_status.in_cleaning == 3:
             await self.send(RoborockCommand.RESUME_SEGMENT_CLEAN)
+            self._set_status(state=RoborockStateCode.segment_cleaning)
         else:
             await self.send(RoborockCommand.APP_START)
+            self._set_status(state=RoborockStateCode.cleaning)
 
     async def async_pause(self) -> None:
         """Pause the vacuum."""
         await self.send(RoborockCommand.APP_PAUSE)
+        self._set_status(state=RoborockStateCode.paused)
 
     async def async_stop(self, **kwargs: Any) -> None:
         """Stop the vacuum."""
@@ -376,6 +460,7 @@ class RoborockVacuum(RoborockCoordinatedEntity, StateVacuumEntity, ABC):
     async def async_return_to_base(self, **kwargs: Any) -> None:
         """Send vacuum back to base."""
         await self.send(RoborockCommand.APP_CHARGE)
+        self._set_status(state=RoborockStateCode.returning_home)
 
     async def async_clean_spot(self, **kwargs: Any) -> None:
         """Spot clean."""
@@ -385,26 +470,34 @@ class RoborockVacuum(RoborockCoordinatedEntity, StateVacuumEntity, ABC):
         """Locate vacuum."""
         await self.send(RoborockCommand.FIND_ME)
 
+    def _set_status(self, **changes: Any) -> None:
+        """Optimistically update the device status until the next refresh reports it."""
+        props = self._device_info.props
+        if props is None or props.status is None:
+            return
+        props.status = dataclasses.replace(props.status, **changes)
+        self.async_write_ha_state()
+
     async def async_set_fan_speed(self, fan_speed: str, **kwargs: Any) -> None:
         """Set vacuum fan speed."""
-        await self.send(
-            RoborockCommand.SET_CUSTOM_MODE,
-            [v for k, v in self._device_status.fan_power.items() if k == fan_speed],
-        )
+        fan_power = self._device_status.fan_power
+        value = _code_value(fan_power, fan_speed)
+        await self.send(RoborockCommand.SET_CUSTOM_MODE, [value])
+        self._set_status(fan_power=type(fan_power)(value))
 
     async def async_set_mop_mode(self, mop_mode: str, _=None) -> None:
         """Change vacuum mop mode."""
-        await self.send(
-            RoborockCommand.SET_MOP_MODE,
-            [v for k, v in self._device_status.mop_mode.items() if k == mop_mode],
-        )
+        current_mop_mode = self._device_status.mop_mode
+        value = _code_value(current_mop_mode, mop_mode)
+        await self.send(RoborockCommand.SET_MOP_MODE, [value])
+        self._set_status(mop_mode=type(current_mop_mode)(value))
 
     async def async_set_mop_intensity(self, mop_intensity: str, _=None):
         """Set vacuum mop intensity."""
-        await self.send(
-            RoborockCommand.SET_WATER_BOX_CUSTOM_MODE,
-            [v for k, v in self._device_status.water_box_mode.items() if k == mop_intensity],
-        )
+        water_box_mode = self._device_status.water_box_mode
+        value = _code_value(water_box_mode, mop_intensity)
+        await self.send(RoborockCommand.SET_WATER_BOX_CUSTOM_MODE, [value])
+        self._set_status(water_box_mode=type(water_box_mode)(value))
 
     async def async_manual_start(self):
         """Start manual control mode."""
@@ -421,25 +514,33 @@ class RoborockVacuum(RoborockCoordinatedEntity, StateVacuumEntity, ABC):
     MANUAL_VELOCITY_MAX = 0.3
     MANUAL_VELOCITY_MIN = -MANUAL_VELOCITY_MAX
     MANUAL_DURATION_DEFAULT = 1500
+    # Omega sent to the vacuum for each valid rotation, starting at MANUAL_ROTATION_MIN
+    _MANUAL_OMEGA = tuple(
+        round(math.radians(rotation), 1) for rotation in range(MANUAL_ROTATION_MIN, MANUAL_ROTATION_MAX + 1)
+    )
+    # Delays between checks for the vacuum to enter remote control mode
+    MANUAL_START_BACKOFF = (0.25, 0.5, 1, 2, 4)
 
     async def async_manual_control(
         self, rotation: int, velocity: float, duration: int = MANUAL_DURATION_DEFAULT
     ):
         """Give a command over manual control interface."""
-        if rotation < self.MANUAL_ROTATION_MIN or rotation > self.MANUAL_ROTATION_MAX:
+        rotation_min, rotation_max = self.MANUAL_ROTATION_MIN, self.MANUAL_ROTATION_MAX
+        if not rotation_min <= rotation <= rotation_max:
             raise ValueError(
-                f"Given rotation is invalid, should be ]{self.MANUAL_ROTATION_MIN}, {self.MANUAL_ROTATION_MAX}[,"
+                f"Given rotation is invalid, should be ]{rotation_min}, {rotation_max}[,"
                 f" was {rotation}"
             )
-        if velocity < self.MANUAL_VELOCITY_MIN or velocity > self.MANUAL_VELOCITY_MAX:
+        velocity_min, velocity_max = self.MANUAL_VELOCITY_MIN, self.MANUAL_VELOCITY_MAX
+        if not velocity_min <= velocity <= velocity_max:
             raise ValueError(
-                f"Given velocity is invalid, should be ]{self.MANUAL_VELOCITY_MIN}, {self.MANUAL_VELOCITY_MAX}[,"
+                f"Given velocity is invalid, should be ]{velocity_min}, {velocity_max}[,"
                 f" was: {velocity}"
             )
 
         self.manual_seqnum += 1
         params = {
-            "omega": round(math.radians(rotation), 1),
+            "omega": self._MANUAL_OMEGA[rotation - rotation_min],
             "velocity": velocity,
             "duration": duration,
             "seqnum": self.manual_seqnum,
@@ -451,17 +552,19 @@ class RoborockVacuum(RoborockCoordinatedEntity, StateVacuumEntity, ABC):
         self, rotation: int, velocity: float, duration: int = MANUAL_DURATION_DEFAULT
     ):
         """Start the remote control mode and executes the action once before deactivating the mode."""
-        number_of_tries = 3
         await self.async_manual_start()
-        while number_of_tries > 0:
-            if self.state == STATE_CODE_TO_STATE[7]:
-                time.sleep(5)
+        # State pushes keep the status current, so one refresh is only a fallback
+        await self.coordinator.async_request_refresh()
+        # Check right away, then again after each backoff delay
+        for delay in (0, *self.MANUAL_START_BACKOFF):
+            if delay:
+                await asyncio.sleep(delay)
+            if self._device_status.state == RoborockStateCode.manual_mode:
+                await asyncio.sleep(5)
                 await self.async_manual_control(rotation, velocity, duration)
-                time.sleep(5)
+                await asyncio.sleep(5)
                 return await self.async_manual_stop()
-
-            time.sleep(2)
-            number_of_tries -= 1
+        raise HomeAssistantError("Vacuum did not enter remote control mode")
 
     async def async_remote_control_start(self):
         """Start remote control mode."""
@@ -494,17 +597,17 @@ class RoborockVacuum(RoborockCoordinatedEntity, StateVacuumEntity, ABC):
         """Clean the specified segments(s)."""
         if isinstance(segments, int):
             segments = [segments]
-
-        if isinstance(segments, str):
+        elif isinstance(segments, str):
             try:
                 segments = [int(s.strip()) for s in segments.split(",")]
             except ValueError:
                 _LOGGER.error("Segments must be a list of integers or a comma separated string of integers")
                 return
+        else:
+            # Don't hand the caller's list over to the command
+            segments = list(segments)
 
-        params = segments
-        if repeats is not None:
-            params = [{"segments": segments, "repeat": repeats}]
+        params = segments if repeats is None else [{"segments": segments, "repeat": repeats}]
 
         await self.send(
             RoborockCommand.APP_SEGMENT_CLEAN,
@@ -513,10 +616,9 @@ class RoborockVacuum(RoborockCoordinatedEntity, StateVacuumEntity, ABC):
 
     async def async_clean_zone(self, zone: list, repeats: int = 1):
         """Clean selected area for the number of repeats indicated."""
-        for _zone in zone:
-            _zone.append(repeats)
-        _LOGGER.debug("Zone with repeats: %s", zone)
-        await self.send(RoborockCommand.APP_ZONED_CLEAN, zone)
+        zones = [[*_zone, repeats] for _zone in zone]
+        _LOGGER.debug("Zone with repeats: %s", zones)
+        await self.send(RoborockCommand.APP_ZONED_CLEAN, zones)
 
     async def async_start_pause(self):
         """Start or pause cleaning if running."""
@@ -531,19 +633,16 @@ class RoborockVacuum(RoborockCoordinatedEntity, StateVacuumEntity, ABC):
 
     async def async_load_multi_map(self, map_flag: int):
         """Load another map."""
-        device_info = self.coordinator.data
-        is_valid_flag = True
-        if device_info.map_mapping:
-            is_valid_flag = device_info.map_mapping.get(map_flag)
-
-        if is_valid_flag:
-            await self.send(RoborockCommand.LOAD_MULTI_MAP, [map_flag])
-            self.set_invalid_map()
-        else:
+        map_mapping = self.coordinator.data.map_mapping
+        if map_mapping and map_flag not in map_mapping:
             raise HomeAssistantError(
-                f"Map flag {map_flag} is invalid"
+                f"Map flag {map_flag} is invalid. Available map flags: {list(map_mapping)}"
             )
 
+        await self.send(RoborockCommand.LOAD_MULTI_MAP, [map_flag])
+        self.set_invalid_map()
+        self._set_status(map_status=get_map_status(map_flag))
+
     async def async_send_command(
         self,
         command: RoborockCommand,
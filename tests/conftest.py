@@ -1,9 +1,10 @@
 """Global fixtures for Roborock integration."""
+import copy
 from unittest.mock import patch
 
 import pytest
 
-from .mock_data import PROP
+from .mock_data import CACHED_VALUES, PROP
 
 
 # This fixture enables loading custom integrations in all tests.
@@ -28,7 +29,7 @@ def bypass_api_fixture():
     ), patch(
         "roborock.cloud_api.RoborockMqttClient.send_command"
     ), patch(
-        "roborock.cloud_api.RoborockMqttClient.get_prop", return_value=PROP
+        "roborock.cloud_api.RoborockMqttClient.get_prop", side_effect=lambda: copy.deepcopy(PROP)
     ), patch(
         "roborock.local_api.RoborockLocalClient.async_connect"
     ), patch(
@@ -38,6 +39,21 @@ def bypass_api_fixture():
     ), patch(
         "roborock.local_api.RoborockLocalClient.send_command"
     ), patch(
-        "roborock.local_api.RoborockLocalClient.get_prop", return_value=PROP
+        "roborock.local_api.RoborockLocalClient.get_prop", side_effect=lambda: copy.deepcopy(PROP)
     ):
         yield
+
+
+@pytest.fixture(name="cache_fixture")
+def cache_fixture():
+    """Answer the commands of the cached attributes with CACHED_VALUES."""
+
+    def send_command(method, params=None):
+        return copy.deepcopy(CACHED_VALUES.get(method))
+
+    with patch(
+        "roborock.cloud_api.RoborockMqttClient._send_command", side_effect=send_command
+    ), patch(
+        "roborock.local_api.RoborockLocalClient._send_command", side_effect=send_command
+    ) as mock_send_command:
+        yield mock_send_command
@@ -14,7 +14,7 @@ from roborock.containers import (
     UserData,
     WashTowelMode,
 )
-from roborock.roborock_typing import DeviceProp, DockSummary
+from roborock.roborock_typing import DeviceProp, DockSummary, RoborockCommand
 
 # All data is based on a U.S. customer with a Roborock S7 MaxV Ultra
 USER_EMAIL = "user@domain.com"
@@ -463,3 +463,23 @@ PROP = DeviceProp(
     CLEAN_RECORD,
     DOCK_SUMMARY
 )
+
+# Values the device sends back for the cached attributes
+CACHED_VALUES = {
+    RoborockCommand.GET_CHILD_LOCK_STATUS: {"lock_status": 0},
+    RoborockCommand.GET_FLOW_LED_STATUS: {"status": 1},
+    RoborockCommand.GET_DND_TIMER: {
+        "start_hour": 22,
+        "start_minute": 0,
+        "end_hour": 7,
+        "end_minute": 30,
+        "enabled": 1,
+    },
+    RoborockCommand.GET_VALLEY_ELECTRICITY_TIMER: {
+        "start_hour": 0,
+        "start_minute": 0,
+        "end_hour": 6,
+        "end_minute": 0,
+        "enabled": 0,
+    },
+}
@@ -0,0 +1,90 @@
+"""Tests for Roborock switches."""
+import pytest
+from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
+from homeassistant.const import SERVICE_TURN_OFF, SERVICE_TURN_ON, STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from roborock.roborock_typing import RoborockCommand
+
+from custom_components.roborock.const import DOMAIN
+
+from .common import setup_platform
+from .mock_data import HOME_DATA
+
+
+def _entity_id(hass: HomeAssistant, key: str) -> str:
+    """Get the entity id of a switch of the first device."""
+    return er.async_get(hass).async_get_entity_id(
+        SWITCH_DOMAIN, DOMAIN, f"{key}_{HOME_DATA.devices[0].duid}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_switch_states(hass: HomeAssistant, bypass_api_fixture, cache_fixture) -> None:
+    """Tests switches are getting the correct values."""
+    mock_config_entry = await setup_platform(hass, SWITCH_DOMAIN)
+    assert hass.states.get(_entity_id(hass, "child_lock")).state == STATE_OFF
+    assert hass.states.get(_entity_id(hass, "flow_led_status")).state == STATE_ON
+    assert hass.states.get(_entity_id(hass, "dnd_switch")).state == STATE_ON
+    assert hass.states.get(_entity_id(hass, "valley_electricity_switch")).state == STATE_OFF
+    await mock_config_entry.async_unload(hass)
+
+
+@pytest.mark.asyncio
+async def test_switch_services(hass: HomeAssistant, bypass_api_fixture, cache_fixture) -> None:
+    """Test turning switches on and off."""
+    mock_config_entry = await setup_platform(hass, SWITCH_DOMAIN)
+    cache_fixture.reset_mock()
+    await hass.services.async_call(
+        SWITCH_DOMAIN,
+        SERVICE_TURN_ON,
+        {"entity_id": _entity_id(hass, "child_lock")},
+        blocking=True,
+    )
+    cache_fixture.assert_any_call(RoborockCommand.SET_CHILD_LOCK_STATUS, {"lock_status": 1})
+
+    cache_fixture.reset_mock()
+    await hass.services.async_call(
+        SWITCH_DOMAIN,
+        SERVICE_TURN_ON,
+        {"entity_id": _entity_id(hass, "valley_electricity_switch")},
+        blocking=True,
+    )
+    cache_fixture.assert_any_call(RoborockCommand.SET_VALLEY_ELECTRICITY_TIMER, [0, 0, 6, 0])
+
+    cache_fixture.reset_mock()
+    await hass.services.async_call(
+        SWITCH_DOMAIN,
+        SERVICE_TURN_OFF,
+        {"entity_id": _entity_id(hass, "dnd_switch")},
+        blocking=True,
+    )
+    cache_fixture.assert_any_call(RoborockCommand.CLOSE_DND_TIMER, None)
+    await mock_config_entry.async_unload(hass)
+
+
+@pytest.mark.asyncio
+async def test_switch_keeps_state_without_value(
+    hass: HomeAssistant, bypass_api_fixture, cache_fixture
+) -> None:
+    """Test a switch keeps its state when its cache has no value."""
+    mock_config_entry = await setup_platform(hass, SWITCH_DOMAIN)
+    entity = hass.data[SWITCH_DOMAIN].get_entity(_entity_id(hass, "flow_led_status"))
+    entity._attribute_cache._value = None
+    entity.coordinator.async_set_updated_data(entity.coordinator.data)
+    await hass.async_block_till_done()
+    assert hass.states.get(_entity_id(hass, "flow_led_status")).state == STATE_ON
+    await mock_config_entry.async_unload(hass)
+
+
+@pytest.mark.asyncio
+async def test_switch_caches_stop_on_unload(
+    hass: HomeAssistant, bypass_api_fixture, cache_fixture
+) -> None:
+    """Test the attribute caches stop refreshing once the entry is unloaded."""
+    mock_config_entry = await setup_platform(hass, SWITCH_DOMAIN)
+    entity = hass.data[SWITCH_DOMAIN].get_entity(_entity_id(hass, "child_lock"))
+    timer = entity._attribute_cache.task._task
+    assert timer is not None and not timer.cancelled()
+    await mock_config_entry.async_unload(hass)
+    assert timer.cancelled()
@@ -0,0 +1,75 @@
+"""Tests for Roborock times."""
+import pytest
+from homeassistant.components.time import ATTR_TIME, DOMAIN as TIME_DOMAIN, SERVICE_SET_VALUE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from roborock.roborock_typing import RoborockCommand
+
+from custom_components.roborock.const import DOMAIN
+
+from .common import setup_platform
+from .mock_data import HOME_DATA
+
+
+def _entity_id(hass: HomeAssistant, key: str) -> str:
+    """Get the entity id of a time of the first device."""
+    return er.async_get(hass).async_get_entity_id(
+        TIME_DOMAIN, DOMAIN, f"{key}_{HOME_DATA.devices[0].duid}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_time_states(hass: HomeAssistant, bypass_api_fixture, cache_fixture) -> None:
+    """Tests times are getting the correct values."""
+    mock_config_entry = await setup_platform(hass, TIME_DOMAIN)
+    assert hass.states.get(_entity_id(hass, "dnd_start")).state == "22:00:00"
+    assert hass.states.get(_entity_id(hass, "dnd_end")).state == "07:30:00"
+    assert hass.states.get(_entity_id(hass, "valley_electricity_start")).state == "00:00:00"
+    assert hass.states.get(_entity_id(hass, "valley_electricity_end")).state == "06:00:00"
+    await mock_config_entry.async_unload(hass)
+
+
+@pytest.mark.asyncio
+async def test_time_set_value(hass: HomeAssistant, bypass_api_fixture, cache_fixture) -> None:
+    """Test setting a time keeps the other end of the timer."""
+    mock_config_entry = await setup_platform(hass, TIME_DOMAIN)
+    cache_fixture.reset_mock()
+    await hass.services.async_call(
+        TIME_DOMAIN,
+        SERVICE_SET_VALUE,
+        {"entity_id": _entity_id(hass, "dnd_start"), ATTR_TIME: "01:02:00"},
+        blocking=True,
+    )
+    cache_fixture.assert_any_call(RoborockCommand.SET_DND_TIMER, [1, 2, 7, 30])
+    await mock_config_entry.async_unload(hass)
+
+
+@pytest.mark.asyncio
+async def test_time_keeps_value_without_value(
+    hass: HomeAssistant, bypass_api_fixture, cache_fixture
+) -> None:
+    """Test a time keeps its value when its cache has no complete value."""
+    mock_config_entry = await setup_platform(hass, TIME_DOMAIN)
+    entity_id = _entity_id(hass, "dnd_start")
+    entity = hass.data[TIME_DOMAIN].get_entity(entity_id)
+    for value in (None, {"start_hour": 5}):
+        entity._attribute_cache._value = value
+        entity.coordinator.async_set_updated_data(entity.coordinator.data)
+        await hass.async_block_till_done()
+        assert hass.states.get(entity_id).state == "22:00:00"
+    await mock_config_entry.async_unload(hass)
+
+
+@pytest.mark.asyncio
+async def test_time_caches_stop_on_unload(
+    hass: HomeAssistant, bypass_api_fixture, cache_fixture
+) -> None:
+    """Test the timer caches stop refreshing once the entry is unloaded."""
+    mock_config_entry = await setup_platform(hass, TIME_DOMAIN)
+    timers = [
+        hass.data[TIME_DOMAIN].get_entity(_entity_id(hass, key))._attribute_cache.task._task
+        for key in ("dnd_start", "valley_electricity_start")
+    ]
+    assert all(timer is not None and not timer.cancelled() for timer in timers)
+    await mock_config_entry.async_unload(hass)
+    assert all(timer.cancelled() for timer in timers)
@@ -1,5 +1,7 @@
 """Tests for Roborock vacuums."""
-from unittest.mock import patch
+import copy
+import dataclasses
+from unittest.mock import call, patch
 
 import pytest
 from homeassistant.components.vacuum import (
@@ -13,14 +15,21 @@ from homeassistant.components.vacuum import (
     SERVICE_SET_FAN_SPEED,
     SERVICE_START,
     SERVICE_STOP,
+    STATE_CLEANING,
+    STATE_PAUSED,
+    STATE_RETURNING,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
-from roborock import RoborockFanSpeedS7MaxV
+from roborock import RoborockErrorCode, RoborockFanSpeedS7MaxV
 from roborock.roborock_typing import RoborockCommand
 
+from custom_components.roborock.const import DOMAIN
+from custom_components.roborock.vacuum import RoborockVacuum
+
 from .common import setup_platform
-from .mock_data import HOME_DATA
+from .mock_data import HOME_DATA, PROP
 
 ENTITY_ID = "vacuum.roborock_s7_maxv"
 DEVICE_ID = HOME_DATA.devices[0].duid
@@ -52,6 +61,7 @@ async def test_vacuum_services(hass: HomeAssistant, bypass_api_fixture) -> None:
         )
         calls += 1
         assert mock_local_api_command.call_count == calls
+        assert hass.states.get(ENTITY_ID).state == STATE_CLEANING
 
         # Test stopping
         await hass.services.async_call(
@@ -59,6 +69,7 @@ async def test_vacuum_services(hass: HomeAssistant, bypass_api_fixture) -> None:
         )
         calls += 1
         assert mock_local_api_command.call_count == calls
+        assert hass.states.get(ENTITY_ID).state == STATE_CLEANING
 
         # Test pausing
         await hass.services.async_call(
@@ -66,6 +77,7 @@ async def test_vacuum_services(hass: HomeAssistant, bypass_api_fixture) -> None:
         )
         calls += 1
         assert mock_local_api_command.call_count == calls
+        assert hass.states.get(ENTITY_ID).state == STATE_PAUSED
 
         # Test return to base
         await hass.services.async_call(
@@ -76,6 +88,7 @@ async def test_vacuum_services(hass: HomeAssistant, bypass_api_fixture) -> None:
         )
         calls += 1
         assert mock_local_api_command.call_count == calls
+        assert hass.states.get(ENTITY_ID).state == STATE_RETURNING
 
         # Test clean spot
         await hass.services.async_call(
@@ -108,12 +121,133 @@ async def test_vacuum_fan_speeds(hass: HomeAssistant, bypass_api_fixture) -> Non
     for speed in RoborockFanSpeedS7MaxV:
         assert speed.name in fanspeeds
     # Test setting fan speed to "Turbo"
-    with patch("custom_components.roborock.vacuum.RoborockVacuum.send") as mock_send:
+    with patch("custom_components.roborock.vacuum.RoborockVacuum.send") as mock_send, pytest.raises(
+        HomeAssistantError
+    ):
         await hass.services.async_call(
             VACUUM_DOMAIN,
             SERVICE_SET_FAN_SPEED,
             {"entity_id": ENTITY_ID, "fan_speed": "Turbo"},
             blocking=True,
         )
-        mock_send.assert_called_once_with(RoborockCommand.SET_CUSTOM_MODE, [])
+    mock_send.assert_not_called()
+    # Test setting fan speed to "turbo"
+    with patch("custom_components.roborock.vacuum.RoborockVacuum.send") as mock_send:
+        await hass.services.async_call(
+            VACUUM_DOMAIN,
+            SERVICE_SET_FAN_SPEED,
+            {"entity_id": ENTITY_ID, "fan_speed": "turbo"},
+            blocking=True,
+        )
+        mock_send.assert_called_once_with(RoborockCommand.SET_CUSTOM_MODE, [103])
+    assert hass.states.get(ENTITY_ID).attributes.get(ATTR_FAN_SPEED) == "turbo"
+    await mock_config_entry.async_unload(hass)
+
+
+@pytest.mark.asyncio
+async def test_vacuum_overlapping_codes(hass: HomeAssistant, bypass_api_fixture) -> None:
+    """Test codes of different types sharing a value keep their own names."""
+    prop = copy.deepcopy(PROP)
+    prop.status = dataclasses.replace(prop.status, error_code=RoborockErrorCode(8))
+    assert prop.status.state == prop.status.error_code
+    with patch(
+        "roborock.local_api.RoborockLocalClient.get_prop", return_value=prop
+    ), patch(
+        "roborock.cloud_api.RoborockMqttClient.get_prop", return_value=prop
+    ):
+        mock_config_entry = await setup_platform(hass, VACUUM_DOMAIN)
+
+    state = hass.states.get(ENTITY_ID)
+    assert state.attributes.get("status") == "charging"
+    assert state.attributes.get("error") == "robot_trapped"
+    await mock_config_entry.async_unload(hass)
+
+
+@pytest.mark.asyncio
+async def test_vacuum_remote_control_move_step_timeout(
+    hass: HomeAssistant, bypass_api_fixture
+) -> None:
+    """Test the move step fails once the vacuum never enters remote control mode."""
+    mock_config_entry = await setup_platform(hass, VACUUM_DOMAIN)
+    with patch(
+        "custom_components.roborock.vacuum.RoborockVacuum.send"
+    ) as mock_send, patch(
+        "custom_components.roborock.vacuum.asyncio.sleep"
+    ) as mock_sleep, pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN,
+            "vacuum_remote_control_move_step",
+            {"entity_id": ENTITY_ID},
+            blocking=True,
+        )
+    mock_send.assert_called_once_with(RoborockCommand.APP_RC_START)
+    assert mock_sleep.call_args_list == [
+        call(delay) for delay in RoborockVacuum.MANUAL_START_BACKOFF
+    ]
+    await mock_config_entry.async_unload(hass)
+
+
+@pytest.mark.asyncio
+async def test_vacuum_mop_settings(hass: HomeAssistant, bypass_api_fixture) -> None:
+    """Test vacuum mop settings are reflected in the state right away."""
+    mock_config_entry = await setup_platform(hass, VACUUM_DOMAIN)
+    entity = hass.data[VACUUM_DOMAIN].get_entity(ENTITY_ID)
+    with patch("custom_components.roborock.vacuum.RoborockVacuum.send") as mock_send:
+        await entity.async_set_mop_mode("deep")
+        mock_send.assert_called_once_with(RoborockCommand.SET_MOP_MODE, [301])
+        mock_send.reset_mock()
+        await entity.async_set_mop_intensity("mild")
+        mock_send.assert_called_once_with(RoborockCommand.SET_WATER_BOX_CUSTOM_MODE, [201])
+    state = hass.states.get(ENTITY_ID)
+    assert state.attributes.get("mop_mode") == "deep"
+    assert state.attributes.get("mop_intensity") == "mild"
+    await mock_config_entry.async_unload(hass)
+
+
+@pytest.mark.asyncio
+async def test_vacuum_load_multi_map(hass: HomeAssistant, bypass_api_fixture) -> None:
+    """Test loading a map always sends the load, even for the map in the status."""
+    mock_config_entry = await setup_platform(hass, VACUUM_DOMAIN)
+    entity = hass.data[VACUUM_DOMAIN].get_entity(ENTITY_ID)
+    entity.coordinator.data.map_mapping = {0: "Downstairs", 1: "Upstairs"}
+    with patch("custom_components.roborock.vacuum.RoborockVacuum.send") as mock_send:
+        # Map flag 0 is loaded according to the status map_status, which may be stale
+        await hass.services.async_call(
+            DOMAIN,
+            "vacuum_load_multi_map",
+            {"entity_id": ENTITY_ID, "map_flag": 0},
+            blocking=True,
+        )
+        mock_send.assert_called_once_with(RoborockCommand.LOAD_MULTI_MAP, [0])
+
+        with pytest.raises(HomeAssistantError):
+            await hass.services.async_call(
+                DOMAIN,
+                "vacuum_load_multi_map",
+                {"entity_id": ENTITY_ID, "map_flag": 2},
+                blocking=True,
+            )
+        mock_send.assert_called_once()
+    await mock_config_entry.async_unload(hass)
+
+
+@pytest.mark.asyncio
+async def test_vacuum_load_multi_map_updates_status(hass: HomeAssistant, bypass_api_fixture) -> None:
+    """Test loading a map records it in the status, so loading back the first map is sent too."""
+    mock_config_entry = await setup_platform(hass, VACUUM_DOMAIN)
+    entity = hass.data[VACUUM_DOMAIN].get_entity(ENTITY_ID)
+    entity.coordinator.data.map_mapping = {0: "Downstairs", 1: "Upstairs"}
+    with patch("custom_components.roborock.vacuum.RoborockVacuum.send") as mock_send:
+        for map_flag in (1, 0):
+            await hass.services.async_call(
+                DOMAIN,
+                "vacuum_load_multi_map",
+                {"entity_id": ENTITY_ID, "map_flag": map_flag},
+                blocking=True,
+            )
+            assert hass.states.get(ENTITY_ID).attributes.get("mapStatus") == map_flag * 4 + 3
+    assert mock_send.call_args_list == [
+        call(RoborockCommand.LOAD_MULTI_MAP, [1]),
+        call(RoborockCommand.LOAD_MULTI_MAP, [0]),
+    ]
     await mock_config_entry.async_unload(hass)